@@ -2,17 +2,50 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
+import logging.handlers
 import os
 import sys
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 from fastmcp import FastMCP
 
+from .token_store import TokenStore
 from .vault_client import VaultClient
 from .tools import register_tools
 
+try:
+    import uvloop
+except ImportError:  # not available on Windows
+    pass
+else:
+    # libuv-backed loop; must be set before FastMCP starts the event loop.
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
 _server: FastMCP | None = None
 
 
+def _configure_logging() -> None:
+    """Send package logs to stderr, batched to avoid a write per event.
+
+    Records are buffered up to 64 at a time; anything at WARNING or above
+    flushes immediately, and logging's atexit hook flushes the rest. Notices
+    that a DUO push is about to be sent are logged at WARNING for that
+    reason: the user needs to see them before their phone buzzes.
+    """
+    stream_handler = logging.StreamHandler(sys.stderr)
+    stream_handler.setFormatter(logging.Formatter("[mcp-gatekeeper] %(message)s"))
+    handler = logging.handlers.MemoryHandler(
+        capacity=64, flushLevel=logging.WARNING, target=stream_handler
+    )
+    logger = logging.getLogger("mcp_gatekeeper")
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+
 def _get_server() -> FastMCP:
     global _server
     if _server is not None:
@@ -30,19 +63,49 @@ def _get_server() -> FastMCP:
         )
         sys.exit(1)
 
-    client = VaultClient(addr=vault_addr, bootstrap_token=bootstrap_token)
-
-    _server = FastMCP(name="mcp-gatekeeper", version="0.1.0")
+    _configure_logging()
+
+    auto_renew_ro = os.environ.get("AUTO_RENEW_RO", "").lower() in ("1", "true", "yes")
+    persist_tokens = os.environ.get("PERSIST_TOKENS", "").lower() in ("1", "true", "yes")
+
+    client = VaultClient(
+        addr=vault_addr,
+        bootstrap_token=bootstrap_token,
+        auto_renew_ro=auto_renew_ro,
+        token_store=TokenStore(bootstrap_token) if persist_tokens else None,
+    )
+
+    @asynccontextmanager
+    async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+        await client.restore_tokens()
+        warm_up = asyncio.create_task(client.warm_up())
+        try:
+            yield
+        finally:
+            warm_up.cancel()
+            await client.aclose()
+
+    _server = FastMCP(name="mcp-gatekeeper", version="0.1.0", lifespan=lifespan)
     register_tools(_server, client)
 
     return _server
 
 
 class _DeferredMCP:
-    """Proxy that lazily creates the FastMCP server on first attribute access."""
+    """Proxy that lazily creates the FastMCP server on first attribute access.
+
+    The first access rebinds module-level `mcp` to the real server; holders
+    of the proxy itself then forward straight to the cached server.
+    """
+
+    _target: FastMCP | None = None
 
     def __getattr__(self, name: str):
-        return getattr(_get_server(), name)
+        target = self._target
+        if target is None:
+            global mcp
+            target = self._target = mcp = _get_server()
+        return getattr(target, name)
 
 
 mcp = _DeferredMCP()
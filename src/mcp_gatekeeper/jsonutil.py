@@ -0,0 +1,42 @@
+"""JSON encode/decode via orjson, with a stdlib fallback for big integers.
+
+orjson only handles integers that fit in 64 bits: it decodes wider ones
+as lossy floats and refuses to encode them. Secret values must round-trip
+exactly, so anything orjson can't represent goes through `json` instead.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any
+
+import orjson
+
+# A run of 19+ digits may be outside orjson's int range (i64 min is 19
+# digits). Digits inside strings or float mantissas also match; that just
+# costs a stdlib parse, never correctness.
+_MAYBE_WIDE_INT = re.compile(rb"\d{19,}")
+
+
+def json_loads(data: bytes) -> Any:
+    """Decode a JSON body, keeping integers of any width exact."""
+    if _MAYBE_WIDE_INT.search(data):
+        return json.loads(data)
+    return orjson.loads(data)
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Encode compact JSON, falling back to stdlib for wide integers."""
+    try:
+        return orjson.dumps(obj)
+    except TypeError:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def json_dumps_pretty(obj: Any) -> str:
+    """Encode 2-space-indented JSON, falling back to stdlib for wide integers."""
+    try:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    except TypeError:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
@@ -0,0 +1,78 @@
+"""Encrypted on-disk persistence for brokered tokens.
+
+Lets a restarted MCP server pick up RO/RW tokens that are still within
+their TTL instead of sending a fresh DUO push. The file is encrypted with
+a Fernet key derived (scrypt) from the bootstrap token, so it is useless
+without the same VAULT_TOKEN, and is written 0600 in a 0700 directory.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import os
+from pathlib import Path
+
+import orjson
+from cryptography.fernet import Fernet, InvalidToken
+
+DEFAULT_TOKEN_CACHE_PATH = Path.home() / ".cache" / "mcp-gatekeeper" / "tokens.json"
+
+_SALT_BYTES = 16
+
+
+class TokenStore:
+    """Reads and writes the encrypted token cache file.
+
+    The payload is a flat dict of token → ISO-8601 wall-clock expiry
+    pairs (`ro_token`, `ro_expiry`, `rw_token`, `rw_expiry`); wall time
+    is stored because monotonic clocks don't survive a restart.
+    """
+
+    def __init__(self, secret: str, path: Path = DEFAULT_TOKEN_CACHE_PATH) -> None:
+        self.path = path
+        self._secret = secret.encode()
+        self._salt: bytes | None = None
+        self._fernet: Fernet | None = None
+
+    def _cipher(self, salt: bytes) -> Fernet:
+        # scrypt is deliberately slow; derive once per salt.
+        if self._fernet is None or salt != self._salt:
+            key = hashlib.scrypt(
+                self._secret, salt=salt, n=2**14, r=8, p=1, dklen=32
+            )
+            self._salt = salt
+            self._fernet = Fernet(base64.urlsafe_b64encode(key))
+        return self._fernet
+
+    def load(self) -> dict | None:
+        """Return the decrypted payload, or None if missing or unreadable."""
+        try:
+            envelope = orjson.loads(self.path.read_bytes())
+            salt = base64.b64decode(envelope["salt"])
+            plaintext = self._cipher(salt).decrypt(envelope["data"].encode())
+            return orjson.loads(plaintext)
+        except (OSError, ValueError, KeyError, TypeError, InvalidToken):
+            return None
+
+    def save(self, payload: dict) -> None:
+        """Encrypt and atomically write `payload` with 0600 permissions."""
+        salt = self._salt or os.urandom(_SALT_BYTES)
+        envelope = {
+            "salt": base64.b64encode(salt).decode(),
+            "data": self._cipher(salt).encrypt(orjson.dumps(payload)).decode(),
+        }
+
+        self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(orjson.dumps(envelope))
+        os.replace(tmp, self.path)
+
+    def clear(self) -> None:
+        """Delete the cache file if present."""
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
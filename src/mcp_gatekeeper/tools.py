@@ -7,18 +7,58 @@ Always use these tools instead.
 
 from __future__ import annotations
 
-import json
+import asyncio
+import functools
+import inspect
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 from fastmcp import FastMCP
 
+from .jsonutil import json_dumps, json_dumps_pretty
 from .vault_client import VaultClient
 
+# Matches the AWS Secrets Manager BatchGetSecretValue limit.
+MAX_BATCH_PATHS = 20
+# Keeps a batch well inside the HTTP connection pool.
+BATCH_CONCURRENCY = 16
+
+_WRITE_MSG = "Secret written to '%s' (version %s)."
+
+
+def _errors_as_result(
+    message: str,
+) -> Callable[[Callable[..., Awaitable[str]]], Callable[..., Awaitable[str]]]:
+    """Return a tool's exceptions to the agent as a string instead of raising.
+
+    `message` is formatted with the tool's arguments plus the exception as
+    `e`. PermissionError text is returned as-is; it already tells the agent
+    what to do next.
+    """
+
+    def decorator(fn: Callable[..., Awaitable[str]]) -> Callable[..., Awaitable[str]]:
+        sig = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> str:
+            try:
+                return await fn(*args, **kwargs)
+            except PermissionError as e:
+                return str(e)
+            except Exception as e:
+                bound = sig.bind(*args, **kwargs)
+                return message.format(e=e, **bound.arguments)
+
+        return wrapper
+
+    return decorator
+
 
 def register_tools(mcp: FastMCP, client: VaultClient) -> None:
     """Register all gatekeeper tools on the FastMCP server."""
 
     @mcp.tool()
+    @_errors_as_result("Authentication failed: {e}")
     async def authenticate() -> str:
         """Authenticate to OpenBao via Duo MFA push to obtain a read-only token.
 
@@ -33,12 +73,10 @@ def register_tools(mcp: FastMCP, client: VaultClient) -> None:
         Triggers a Duo push notification. Blocks until approved/denied/timeout.
         On success, an RO token is held for ~4 hours.
         """
-        try:
-            return await client.authenticate()
-        except Exception as e:
-            return f"Authentication failed: {e}"
+        return await client.authenticate()
 
     @mcp.tool()
+    @_errors_as_result("Error reading secret at '{path}': {e}")
     async def read_secret(path: str) -> str:
         """Read a secret from OpenBao. This is the ONLY way to read secrets.
 
@@ -55,13 +93,54 @@ def register_tools(mcp: FastMCP, client: VaultClient) -> None:
         Args:
             path: Secret path relative to the KV v2 mount (e.g. "cloudflare")
         """
+        data = await client.read_secret(path)
+        return json_dumps_pretty(data)
+
+    @mcp.tool()
+    async def read_secrets(paths: list[str]) -> str:
+        """Read several secrets from OpenBao in one call.
+
+        Never use curl, kubectl, or the OpenBao API directly. Prefer this
+        over repeated read_secret calls when you need more than one secret:
+        the reads are issued concurrently.
+
+        Same token handling as read_secret. A failure on one path does not
+        fail the batch; that path maps to an error string instead.
+
+        Args:
+            paths: Up to 20 secret paths relative to the KV v2 mount
+        """
+        if len(paths) > MAX_BATCH_PATHS:
+            return (
+                f"Error: at most {MAX_BATCH_PATHS} paths per call "
+                f"(got {len(paths)})."
+            )
+        if not paths:
+            return json_dumps_pretty({})
         try:
-            data = await client.read_secret(path)
-            return json.dumps(data, indent=2)
+            await client.ensure_read_token()
         except Exception as e:
-            return f"Error reading secret at '{path}': {e}"
+            return f"Authentication failed: {e}"
+
+        sem = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+        async def _read(path: str) -> dict:
+            async with sem:
+                return await client.read_secret(path)
+
+        results = await asyncio.gather(
+            *(_read(p) for p in paths), return_exceptions=True
+        )
+        out: dict[str, Any] = {}
+        for path, result in zip(paths, results):
+            if isinstance(result, BaseException):
+                out[path] = f"Error reading secret at '{path}': {result}"
+            else:
+                out[path] = result
+        return json_dumps_pretty(out)
 
     @mcp.tool()
+    @_errors_as_result("Error writing secret at '{path}': {e}")
     async def write_secret(path: str, data: dict[str, Any]) -> str:
         """Write or update a secret in OpenBao. This is the ONLY way to write secrets.
 
@@ -75,16 +154,12 @@ def register_tools(mcp: FastMCP, client: VaultClient) -> None:
             path: Secret path relative to the KV v2 mount (e.g. "claude/config")
             data: Key-value pairs to write
         """
-        try:
-            result = await client.write_secret(path, data)
-            version = result.get("data", {}).get("version", "unknown")
-            return f"Secret written to '{path}' (version {version})."
-        except PermissionError as e:
-            return str(e)
-        except Exception as e:
-            return f"Error writing secret at '{path}': {e}"
+        result = await client.write_secret(path, data)
+        version = result.get("data", {}).get("version", "unknown")
+        return _WRITE_MSG % (path, version)
 
     @mcp.tool()
+    @_errors_as_result("Error listing secrets at '{path}': {e}")
     async def list_secrets(path: str) -> str:
         """List secret keys at a path in OpenBao. This is the ONLY way to list secrets.
 
@@ -99,15 +174,14 @@ def register_tools(mcp: FastMCP, client: VaultClient) -> None:
         Args:
             path: Path to list (e.g. "ssh/" or "minio/")
         """
-        try:
-            keys = await client.list_secrets(path)
-            if not keys:
-                return f"No secrets found at '{path}'."
-            return json.dumps(keys, indent=2)
-        except Exception as e:
-            return f"Error listing secrets at '{path}': {e}"
+        keys = await client.list_secrets(path)
+        if not keys:
+            return f"No secrets found at '{path}'."
+        # Flat list of names: pretty-printing only adds a line per key.
+        return json_dumps(keys).decode()
 
     @mcp.tool()
+    @_errors_as_result("Escalation failed: {e}")
     async def escalate() -> str:
         """Escalate from read-only to read-write access via a second Duo push.
 
@@ -118,12 +192,10 @@ def register_tools(mcp: FastMCP, client: VaultClient) -> None:
         On success, an RW token is held for ~15 minutes. After expiry,
         access drops back to RO automatically.
         """
-        try:
-            return await client.escalate()
-        except Exception as e:
-            return f"Escalation failed: {e}"
+        return await client.escalate()
 
     @mcp.tool()
+    @_errors_as_result("De-escalation failed: {e}")
     async def deescalate() -> str:
         """Revoke the RW token and drop back to read-only access.
 
@@ -131,12 +203,10 @@ def register_tools(mcp: FastMCP, client: VaultClient) -> None:
         revoke the RW token rather than waiting for the 15min TTL to expire.
         Good practice after completing a write task.
         """
-        try:
-            return await client.deescalate()
-        except Exception as e:
-            return f"De-escalation failed: {e}"
+        return await client.deescalate()
 
     @mcp.tool()
+    @_errors_as_result("Logout failed: {e}")
     async def logout() -> str:
         """Revoke all tokens and drop to no_access.
 
@@ -144,10 +214,7 @@ def register_tools(mcp: FastMCP, client: VaultClient) -> None:
         for TTL expiry. Use at the end of a session or when you want
         to fully disconnect from OpenBao.
         """
-        try:
-            return await client.logout()
-        except Exception as e:
-            return f"Logout failed: {e}"
+        return await client.logout()
 
     @mcp.tool()
     async def token_status() -> str:
@@ -157,4 +224,4 @@ def register_tools(mcp: FastMCP, client: VaultClient) -> None:
         token is held, and remaining TTL for active tokens.
         """
         status = client.token_status()
-        return json.dumps(status, indent=2)
+        return json_dumps_pretty(status)
@@ -1,25 +1,70 @@
 """OpenBao HTTP client with zero-standing-access token management.
 
 Token lifecycle:
-  No Access (default) → authenticate (DUO push) → RO (4hr TTL)
+  No Access (default) → authenticate (DUO push) → RO (4hr initial TTL)
+  RO near expiry, with reads since the last renewal → renew-self in the
+    background (no DUO), up to the claude-ro role's max_ttl
+  RO near expiry, idle session → not renewed; expires at its TTL
+  RO at max_ttl → background DUO push if AUTO_RENEW_RO, else the next
+    read re-auths (DUO push) → RO
   RO → escalate (second DUO push) → RW (15min TTL)
   RW expires → drops to RO (explicit re-escalation required)
-  RO expires → auto re-auth (DUO push) → RO
 
-RO auto-renews transparently (session-scoped consent — "yes I'm working").
-RW requires explicit re-escalation (task-scoped consent — "yes do this
-dangerous thing"). The 15min TTL is a hard boundary, not a rolling window.
+RO auto-renews transparently while in use (session-scoped consent — "yes
+I'm working"): an active session lasts up to the role's max_ttl on one
+approval, an idle one expires at the 4hr TTL as before. RW requires explicit
+re-escalation (task-scoped consent — "yes do this dangerous thing"). The
+15min TTL is a hard boundary, not a rolling window.
 """
 
 from __future__ import annotations
 
-import sys
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
 from datetime import datetime, timedelta, timezone
 
 import httpx
 
+from .jsonutil import json_dumps, json_loads
+from .token_store import TokenStore
+
+logger = logging.getLogger(__name__)
+
+_AUTH_MSG = "Authentication successful. RO token acquired with %ds TTL (expires %s)."
+_ESCALATE_MSG = "Escalation successful. RW token acquired with %ds TTL (expires %s)."
+
 DUO_METHOD_ID = "a573c36b-3cb4-4ee1-b947-bc1a81bb674a"
 
+# sys/mfa/validate blocks until the Duo push is answered. Give up on an
+# unanswered push after Duo's typical push lifetime rather than sitting on
+# the 120s HTTP read timeout. A timed-out validate is never re-sent: the
+# push may still be live, and a retry would fire a second one. Only a 429
+# (request not processed) is retried, with the same MFA request ID.
+MFA_PUSH_TIMEOUT = 60.0
+MFA_VALIDATE_ATTEMPTS = 2
+MFA_RETRY_BACKOFF = 1.0
+MFA_MAX_RETRY_AFTER = 30.0
+
+# Short-lived read cache so repeated reads of the same path within a
+# session don't each pay an HTTPS round-trip.
+SECRET_CACHE_TTL = 30.0
+SECRET_CACHE_MAXSIZE = 256
+
+# Background RO renewal: renew-self this long before expiry, asking for
+# this much more TTL (Vault still caps it at the role's max_ttl).
+RO_RENEW_MARGIN = 300.0
+RO_RENEW_INCREMENT = 14400
+
+# KV paths (readable with the bootstrap token) holding each userpass
+# account's password.
+USERPASS_PASSWORD_PATHS = {
+    "claude-ro": "secret/data/claude/ro-login",
+    "claude-rw": "secret/data/claude/rw-login",
+}
+
 
 class VaultClient:
     """Wraps the OpenBao HTTP API with zero-standing-access token brokering.
@@ -27,37 +72,137 @@ class VaultClient:
     Starts with no tokens. A bootstrap token (from VSO) is used only to
     read the userpass credentials needed to trigger DUO-gated auth flows.
 
-    RO renewal is transparent — expired RO tokens are re-obtained via
-    DUO push automatically on read/list. RW tokens are NOT auto-renewed;
+    RO renewal is transparent — held RO tokens that have been used since
+    their last renewal are extended in the background via renew-self, and
+    expired RO tokens are re-obtained via DUO push automatically on
+    read/list. RW tokens are NOT auto-renewed;
     expired RW means writes fail until the user explicitly calls escalate.
+
+    With `auto_renew_ro`, an RO token that can no longer be extended is
+    replaced ahead of expiry by a background DUO push instead of waiting
+    for the next read to block on one.
+
+    With a `token_store`, held tokens are persisted (encrypted) so a
+    restarted server can resume them via `restore_tokens`.
     """
 
-    def __init__(self, addr: str, bootstrap_token: str) -> None:
+    def __init__(
+        self,
+        addr: str,
+        bootstrap_token: str,
+        auto_renew_ro: bool = False,
+        token_store: TokenStore | None = None,
+    ) -> None:
         self.addr = addr.rstrip("/")
+        # Absolute KV v2 prefixes for the hot paths: httpx sends absolute
+        # URLs as-is instead of merging each one against base_url.
+        self._secret_data_url = f"{self.addr}/v1/secret/data/"
+        self._secret_metadata_url = f"{self.addr}/v1/secret/metadata/"
         self._bootstrap_token = bootstrap_token
+        self._auto_renew_ro = auto_renew_ro
+        self._token_store = token_store
+        # *_deadline (time.monotonic()) drives validity checks; *_expiry
+        # (wall clock) is kept only for human-readable status, with its
+        # isoformat cached per token. _*_headers is likewise built once
+        # per token rather than per request.
         self.ro_token: str | None = None
+        self.ro_token_deadline: float | None = None
         self.ro_token_expiry: datetime | None = None
+        self.ro_token_expiry_iso: str | None = None
+        self._ro_headers: dict[str, str] | None = None
         self.rw_token: str | None = None
+        self.rw_token_deadline: float | None = None
         self.rw_token_expiry: datetime | None = None
-        self._http = httpx.AsyncClient(base_url=self.addr, timeout=120)
+        self.rw_token_expiry_iso: str | None = None
+        self._rw_headers: dict[str, str] | None = None
+        self._status_cache: dict = {
+            "tier": "no_access",
+            "ro_token": False,
+            "rw_token": False,
+        }
+        self._status_key: tuple[str | None, str | None] = (None, None)
+        # (tier, path) → (monotonic fetch time, secret data), LRU-ordered
+        self._secret_cache: OrderedDict[tuple[str, str], tuple[float, dict]] = (
+            OrderedDict()
+        )
+        # Bumped on every invalidation; a read only caches its result if no
+        # write or tier change happened while its GET was in flight.
+        self._secret_cache_gen = 0
+        # In-flight DUO flows, shared by concurrent callers so N racing
+        # requests produce one push instead of N.
+        self._auth_inflight: asyncio.Task[str] | None = None
+        self._escalate_inflight: asyncio.Task[str] | None = None
+        self._refresh_task: asyncio.Task[None] | None = None
+        # Monotonic times of the last read/list and of the last RO issue or
+        # renewal; background renewal only happens if the former is newer.
+        self._last_activity = 0.0
+        self._ro_renewed_at = 0.0
+        # Userpass passwords don't rotate within a session; caching them
+        # saves a round-trip on every authenticate/escalate after the first.
+        self._userpass_cache: dict[str, str] = {}
+        self._userpass_cache_lock = asyncio.Lock()
+        # One pooled HTTP/2 client for the life of the process: concurrent
+        # reads multiplex over a single TLS connection instead of paying a
+        # fresh handshake each. The long read timeout covers the Duo push
+        # wait in sys/mfa/validate; connects should fail fast.
+        self._http = httpx.AsyncClient(
+            base_url=self.addr,
+            timeout=httpx.Timeout(120.0, connect=5.0),
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(
+                    max_keepalive_connections=64,
+                    max_connections=128,
+                    keepalive_expiry=300.0,
+                ),
+                retries=2,
+            ),
+        )
+
+    async def warm_up(self) -> None:
+        """Open a pooled connection to OpenBao ahead of the first request.
+
+        Hits the unauthenticated sys/health endpoint so TCP/TLS setup
+        happens while the session is idle rather than inside the first,
+        user-perceived authenticate. Failures are ignored; the real
+        request will surface them.
+        """
+        try:
+            await self._http.get(
+                "/v1/sys/health",
+                params={"standbyok": "true", "perfstandbyok": "true"},
+            )
+        except httpx.HTTPError as e:
+            logger.info("Connection warm-up failed: %s", e)
+
+    async def aclose(self) -> None:
+        """Stop background renewal and close the HTTP connection pool."""
+        self._stop_refresh()
+        await self._http.aclose()
 
     # ── Token validity checks ────────────────────────────────────────
 
     def _has_valid_ro_token(self) -> bool:
-        if not self.ro_token or not self.ro_token_expiry:
+        if not self.ro_token or self.ro_token_deadline is None:
             return False
-        if datetime.now(timezone.utc) >= self.ro_token_expiry:
+        if time.monotonic() >= self.ro_token_deadline:
             self.ro_token = None
+            self.ro_token_deadline = None
             self.ro_token_expiry = None
+            self.ro_token_expiry_iso = None
+            self._ro_headers = None
             return False
         return True
 
     def _has_valid_rw_token(self) -> bool:
-        if not self.rw_token or not self.rw_token_expiry:
+        if not self.rw_token or self.rw_token_deadline is None:
             return False
-        if datetime.now(timezone.utc) >= self.rw_token_expiry:
+        if time.monotonic() >= self.rw_token_deadline:
             self.rw_token = None
+            self.rw_token_deadline = None
             self.rw_token_expiry = None
+            self.rw_token_expiry_iso = None
+            self._rw_headers = None
             return False
         return True
 
@@ -84,60 +229,97 @@ class VaultClient:
         if self._has_valid_ro_token():
             return self.ro_token
 
-        print("[mcp-gatekeeper] RO token expired or missing, re-authenticating via DUO...", file=sys.stderr)
+        logger.warning("RO token expired or missing, re-authenticating via DUO...")
         await self.authenticate()
         return self.ro_token
 
-    async def _best_read_token(self) -> str:
-        """Return the best token for reads: RW if held, else RO (auto-renewed).
+    async def _best_read_headers(self) -> dict[str, str]:
+        """Return auth headers for reads: RW if held, else RO (auto-renewed).
 
         When escalated, uses the RW token to bypass claude-ro deny rules.
         When not escalated, falls back to RO with transparent renewal.
         """
+        self._last_activity = time.monotonic()
+        if self._has_valid_ro_token():
+            self._start_refresh()  # resume if an idle period stopped it
         if self._has_valid_rw_token():
-            return self.rw_token
-        return await self._ensure_ro_token()
+            return self._rw_headers
+        await self._ensure_ro_token()
+        return self._ro_headers
+
+    async def ensure_read_token(self) -> None:
+        """Make sure a read-capable token is held, triggering DUO if needed.
+
+        Lets callers fanning out concurrent reads authenticate once up
+        front instead of having every read race into the DUO flow.
+        """
+        await self._best_read_headers()
 
     # ── KV v2 operations ─────────────────────────────────────────────
 
     async def read_secret(self, path: str) -> dict:
-        """Read a KV v2 secret. Uses RW token if held, else RO (auto-renewed)."""
-        token = await self._best_read_token()
+        """Read a KV v2 secret. Uses RW token if held, else RO (auto-renewed).
+
+        Results are cached per (tier, path) for SECRET_CACHE_TTL seconds.
+        """
+        headers = await self._best_read_headers()
+        key = ("rw" if headers is self._rw_headers else "ro", path)
+
+        cached = self._secret_cache.get(key)
+        if cached is not None:
+            fetched_at, data = cached
+            if time.monotonic() - fetched_at < SECRET_CACHE_TTL:
+                self._secret_cache.move_to_end(key)
+                return data
+            del self._secret_cache[key]
+
+        gen = self._secret_cache_gen
         resp = await self._http.get(
-            f"/v1/secret/data/{path}",
-            headers=self._headers(token),
+            self._secret_data_url + path,
+            headers=headers,
         )
-        resp.raise_for_status()
-        body = resp.json()
-        return body.get("data", {}).get("data", {})
+        if resp.status_code >= 300:
+            resp.raise_for_status()
+        body = json_loads(resp.content)
+        data = body.get("data", {}).get("data", {})
+
+        if gen == self._secret_cache_gen:
+            self._secret_cache[key] = (time.monotonic(), data)
+            if len(self._secret_cache) > SECRET_CACHE_MAXSIZE:
+                self._secret_cache.popitem(last=False)
+        return data
 
     async def write_secret(self, path: str, data: dict) -> dict:
         """Write a KV v2 secret. Requires a valid RW token (no auto-renewal)."""
-        if not self._has_valid_rw_token():
+        headers = self._rw_headers
+        deadline = self.rw_token_deadline
+        if headers is None or deadline is None or time.monotonic() >= deadline:
             raise PermissionError(
                 "RW token expired or not held. Call `escalate` to obtain a "
                 "new read-write token (requires Duo approval)."
             )
         resp = await self._http.post(
-            f"/v1/secret/data/{path}",
-            headers=self._headers(self.rw_token),
-            json={"data": data},
+            self._secret_data_url + path,
+            headers={**headers, "Content-Type": "application/json"},
+            content=json_dumps({"data": data}),
         )
         resp.raise_for_status()
-        return resp.json()
+        self._invalidate_secret(path)
+        return json_loads(resp.content)
 
     async def list_secrets(self, path: str) -> list[str]:
         """List secret keys at a given path. Uses RW token if held, else RO (auto-renewed)."""
-        token = await self._best_read_token()
+        headers = await self._best_read_headers()
         resp = await self._http.request(
             "LIST",
-            f"/v1/secret/metadata/{path}",
-            headers=self._headers(token),
+            self._secret_metadata_url + path,
+            headers=headers,
         )
         if resp.status_code == 404:
             return []
-        resp.raise_for_status()
-        body = resp.json()
+        if resp.status_code >= 300:
+            resp.raise_for_status()
+        body = json_loads(resp.content)
         return body.get("data", {}).get("keys", [])
 
     # ── DUO-gated authentication (No Access → RO) ───────────────────
@@ -146,32 +328,32 @@ class VaultClient:
         """Obtain an RO token via DUO push.
 
         1. Fetch claude-ro password from KV using the bootstrap token
+           (cached after the first call)
         2. Login via userpass to get an MFA request ID
         3. Validate MFA (triggers Duo push) → RO token (4hr TTL)
+
+        Concurrent calls join the flow already in progress.
         """
-        password_data = await self._read_with_token(
-            "secret/data/claude/ro-login", self._bootstrap_token
-        )
-        password = password_data.get("password")
-        if not password:
-            raise RuntimeError(
-                "Failed to retrieve claude-ro password from "
-                "secret/claude/ro-login"
-            )
+        return await self._coalesce("_auth_inflight", self._authenticate)
 
+    async def _authenticate(self) -> str:
         client_token, lease_duration = await self._userpass_duo_flow(
-            "claude-ro", password
+            "claude-ro"
         )
 
         self.ro_token = client_token
+        self._ro_headers = self._headers(client_token)
+        self.ro_token_deadline = time.monotonic() + lease_duration
+        self._ro_renewed_at = time.monotonic()
         self.ro_token_expiry = datetime.now(timezone.utc) + timedelta(
             seconds=lease_duration
         )
+        self.ro_token_expiry_iso = self.ro_token_expiry.isoformat()
+        self._clear_secret_cache()
+        self._start_refresh()
+        self._persist_tokens()
 
-        return (
-            f"Authentication successful. RO token acquired with "
-            f"{lease_duration}s TTL (expires {self.ro_token_expiry.isoformat()})."
-        )
+        return _AUTH_MSG % (lease_duration, self.ro_token_expiry_iso)
 
     # ── DUO-gated escalation (RO → RW) ──────────────────────────────
 
@@ -179,35 +361,33 @@ class VaultClient:
         """Obtain an RW token via a second DUO push.
 
         Ensures RO token is valid first (re-auths if needed), then:
-        1. Fetch claude-rw password from KV using the RO token
+        1. Fetch claude-rw password from KV using the bootstrap token
+           (cached after the first call)
         2. Login via userpass to get an MFA request ID
         3. Validate MFA (triggers Duo push) → RW token (15min TTL)
+
+        Concurrent calls join the flow already in progress.
         """
-        await self._ensure_ro_token()
+        return await self._coalesce("_escalate_inflight", self._escalate)
 
-        password_data = await self._read_with_token(
-            "secret/data/claude/rw-login", self._bootstrap_token
-        )
-        password = password_data.get("password")
-        if not password:
-            raise RuntimeError(
-                "Failed to retrieve claude-rw password from "
-                "secret/claude/rw-login"
-            )
+    async def _escalate(self) -> str:
+        await self._ensure_ro_token()
 
         client_token, lease_duration = await self._userpass_duo_flow(
-            "claude-rw", password
+            "claude-rw"
         )
 
         self.rw_token = client_token
+        self._rw_headers = self._headers(client_token)
+        self.rw_token_deadline = time.monotonic() + lease_duration
         self.rw_token_expiry = datetime.now(timezone.utc) + timedelta(
             seconds=lease_duration
         )
+        self.rw_token_expiry_iso = self.rw_token_expiry.isoformat()
+        self._clear_secret_cache()
+        self._persist_tokens()
 
-        return (
-            f"Escalation successful. RW token acquired with "
-            f"{lease_duration}s TTL (expires {self.rw_token_expiry.isoformat()})."
-        )
+        return _ESCALATE_MSG % (lease_duration, self.rw_token_expiry_iso)
 
     # ── De-escalation (RW → RO) ────────────────────────────────────
 
@@ -225,14 +405,19 @@ class VaultClient:
         try:
             resp = await self._http.post(
                 "/v1/auth/token/revoke-self",
-                headers=self._headers(self.rw_token),
+                headers=self._rw_headers,
             )
             resp.raise_for_status()
         except Exception:
             pass  # best-effort revoke; clear local state regardless
 
         self.rw_token = None
+        self.rw_token_deadline = None
         self.rw_token_expiry = None
+        self.rw_token_expiry_iso = None
+        self._rw_headers = None
+        self._clear_secret_cache()
+        self._persist_tokens()
 
         tier = "ro" if self._has_valid_ro_token() else "no_access"
         return f"RW token revoked. Dropped to {tier}."
@@ -254,69 +439,346 @@ class VaultClient:
             try:
                 resp = await self._http.post(
                     "/v1/auth/token/revoke-self",
-                    headers=self._headers(self.rw_token),
+                    headers=self._rw_headers,
                 )
                 resp.raise_for_status()
             except Exception:
                 pass
             self.rw_token = None
+            self.rw_token_deadline = None
             self.rw_token_expiry = None
+            self.rw_token_expiry_iso = None
+            self._rw_headers = None
             revoked.append("RW")
 
         if self._has_valid_ro_token():
             try:
                 resp = await self._http.post(
                     "/v1/auth/token/revoke-self",
-                    headers=self._headers(self.ro_token),
+                    headers=self._ro_headers,
                 )
                 resp.raise_for_status()
             except Exception:
                 pass
             self.ro_token = None
+            self.ro_token_deadline = None
             self.ro_token_expiry = None
+            self.ro_token_expiry_iso = None
+            self._ro_headers = None
             revoked.append("RO")
+            self._stop_refresh()
 
+        self._clear_secret_cache()
+        self._persist_tokens()
         return f"{' and '.join(revoked)} token(s) revoked. Dropped to no_access."
 
+    # ── Background RO renewal ──────────────────────────────────────
+
+    def _start_refresh(self) -> None:
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    def _stop_refresh(self) -> None:
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+
+    async def _refresh_loop(self) -> None:
+        """Keep the RO token alive so reads never block on a DUO push.
+
+        Sleeps until RO_RENEW_MARGIN before expiry, then extends the token
+        via renew-self (no DUO) — but only if there was a read or list since
+        the last renewal. An idle session exits instead, so the token
+        expires at its TTL; the next read restarts the loop. Once the token
+        can't be extended any further, falls back to a fresh DUO push if
+        `auto_renew_ro` is set; otherwise exits and leaves re-auth to the
+        next read.
+        """
+        while self._has_valid_ro_token():
+            delay = self.ro_token_deadline - RO_RENEW_MARGIN - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                if not self._has_valid_ro_token():
+                    return
+            if self._last_activity <= self._ro_renewed_at:
+                return
+
+            if await self._renew_ro_token():
+                continue
+            if not self._auto_renew_ro:
+                return
+            logger.warning("RO token at max TTL, re-authenticating via DUO...")
+            try:
+                await self.authenticate()
+            except Exception as e:
+                logger.error("Background re-authentication failed: %s", e)
+                return
+
+    async def _renew_ro_token(self) -> bool:
+        """Extend the RO token via renew-self.
+
+        Returns False if the renewal failed or didn't push expiry past
+        the renewal margin (i.e. the token is at its max TTL).
+        """
+        token = self.ro_token
+        try:
+            resp = await self._http.post(
+                "/v1/auth/token/renew-self",
+                headers=self._ro_headers,
+                json={"increment": RO_RENEW_INCREMENT},
+            )
+        except httpx.HTTPError:
+            return False
+        if self.ro_token != token:
+            return True  # replaced while we were renewing
+        if resp.status_code == 403:
+            # The token itself was rejected (revoked server-side)
+            self._forget_ro_token()
+            return False
+        if resp.status_code >= 300:
+            return False
+
+        body = json_loads(resp.content)
+        lease_duration = body.get("auth", {}).get("lease_duration", 0)
+        if lease_duration <= RO_RENEW_MARGIN:
+            return False
+        self.ro_token_deadline = time.monotonic() + lease_duration
+        self._ro_renewed_at = time.monotonic()
+        self.ro_token_expiry = datetime.now(timezone.utc) + timedelta(
+            seconds=lease_duration
+        )
+        self.ro_token_expiry_iso = self.ro_token_expiry.isoformat()
+        self._persist_tokens()
+        return True
+
+    # ── Token persistence ──────────────────────────────────────────
+
+    async def restore_tokens(self) -> None:
+        """Resume persisted tokens that OpenBao still accepts.
+
+        No-op without a token store. Each saved token is checked with
+        lookup-self first; one that is rejected (e.g. revoked by a logout
+        in another session sharing the cache) is dropped and the file
+        rewritten without it. Must run inside the event loop, since a
+        restored RO token resumes background renewal.
+        """
+        if self._token_store is None:
+            return
+        saved = self._token_store.load()
+        if not saved:
+            return
+        now = datetime.now(timezone.utc)
+
+        ro_token = saved.get("ro_token")
+        ro_remaining = await self._lookup_remaining_ttl(
+            ro_token, _remaining_seconds(saved.get("ro_expiry"), now)
+        )
+        if ro_remaining > 0:
+            self.ro_token = ro_token
+            self._ro_headers = self._headers(ro_token)
+            self.ro_token_deadline = time.monotonic() + ro_remaining
+            self._ro_renewed_at = time.monotonic()
+            self.ro_token_expiry = now + timedelta(seconds=ro_remaining)
+            self.ro_token_expiry_iso = self.ro_token_expiry.isoformat()
+            self._start_refresh()
+
+        rw_token = saved.get("rw_token")
+        rw_remaining = await self._lookup_remaining_ttl(
+            rw_token, _remaining_seconds(saved.get("rw_expiry"), now)
+        )
+        if rw_remaining > 0:
+            self.rw_token = rw_token
+            self._rw_headers = self._headers(rw_token)
+            self.rw_token_deadline = time.monotonic() + rw_remaining
+            self.rw_token_expiry = now + timedelta(seconds=rw_remaining)
+            self.rw_token_expiry_iso = self.rw_token_expiry.isoformat()
+
+        # Drops expired or rejected entries from the file.
+        self._persist_tokens()
+        if self.ro_token or self.rw_token:
+            logger.info("Restored persisted tokens.")
+
+    async def _lookup_remaining_ttl(
+        self, token: str | None, saved_remaining: float
+    ) -> float:
+        """Return a restored token's remaining TTL, or 0 if unusable.
+
+        Asks lookup-self, which is authoritative; a 403 means the token
+        was revoked. If OpenBao can't be reached, trusts the saved expiry
+        and leaves rejection to the background renewal.
+        """
+        if not token or saved_remaining <= 0:
+            return 0.0
+        try:
+            resp = await self._http.get(
+                "/v1/auth/token/lookup-self",
+                headers=self._headers(token),
+            )
+        except httpx.HTTPError:
+            return saved_remaining
+        if resp.status_code == 403:
+            return 0.0
+        if resp.status_code >= 300:
+            return saved_remaining
+        ttl = json_loads(resp.content).get("data", {}).get("ttl")
+        if isinstance(ttl, int) and ttl > 0:
+            return float(ttl)
+        return saved_remaining
+
+    def _persist_tokens(self) -> None:
+        """Write currently held tokens to the token store (or clear it)."""
+        if self._token_store is None:
+            return
+        payload: dict = {}
+        if self._has_valid_ro_token():
+            payload["ro_token"] = self.ro_token
+            payload["ro_expiry"] = self.ro_token_expiry_iso
+        if self._has_valid_rw_token():
+            payload["rw_token"] = self.rw_token
+            payload["rw_expiry"] = self.rw_token_expiry_iso
+        try:
+            if payload:
+                self._token_store.save(payload)
+            else:
+                self._token_store.clear()
+        except OSError as e:
+            logger.warning("Failed to persist tokens: %s", e)
+
+    def _forget_ro_token(self) -> None:
+        """Drop an RO token OpenBao has rejected, in memory and on disk."""
+        self.ro_token = None
+        self.ro_token_deadline = None
+        self.ro_token_expiry = None
+        self.ro_token_expiry_iso = None
+        self._ro_headers = None
+        self._clear_secret_cache()
+        self._persist_tokens()
+
     # ── Token status ─────────────────────────────────────────────────
 
     def token_status(self) -> dict:
-        """Return current token state across all three tiers."""
-        now = datetime.now(timezone.utc)
+        """Return current token state across all three tiers.
+
+        The returned dict is a cached snapshot, rebuilt only when a token
+        is issued, renewed or dropped; per call, just the remaining-TTL
+        fields are refreshed. Callers must not mutate it.
+        """
+        ro_valid = self._has_valid_ro_token()
+        rw_valid = self._has_valid_rw_token()
+
+        # Every token state change sets or clears its cached expiry string,
+        # so the pair identifies the state the snapshot was built from.
+        key = (self.ro_token_expiry_iso, self.rw_token_expiry_iso)
+        if key != self._status_key:
+            self._recompute_status(ro_valid, rw_valid)
+            self._status_key = key
+
+        status = self._status_cache
+        now = time.monotonic()
+        if ro_valid:
+            status["ro_token_remaining_seconds"] = int(self.ro_token_deadline - now)
+        if rw_valid:
+            status["rw_token_remaining_seconds"] = int(self.rw_token_deadline - now)
+        return status
+
+    def _recompute_status(self, ro_valid: bool, rw_valid: bool) -> None:
         status: dict = {"tier": "no_access"}
 
-        if self._has_valid_ro_token():
-            remaining = (self.ro_token_expiry - now).total_seconds()
+        if ro_valid:
             status["ro_token"] = True
-            status["ro_token_remaining_seconds"] = int(remaining)
-            status["ro_token_expiry"] = self.ro_token_expiry.isoformat()
+            status["ro_token_remaining_seconds"] = 0
+            status["ro_token_expiry"] = self.ro_token_expiry_iso
             status["tier"] = "ro"
         else:
             status["ro_token"] = False
 
-        if self._has_valid_rw_token():
-            remaining = (self.rw_token_expiry - now).total_seconds()
+        if rw_valid:
             status["rw_token"] = True
-            status["rw_token_remaining_seconds"] = int(remaining)
-            status["rw_token_expiry"] = self.rw_token_expiry.isoformat()
+            status["rw_token_remaining_seconds"] = 0
+            status["rw_token_expiry"] = self.rw_token_expiry_iso
             status["tier"] = "rw"
         else:
             status["rw_token"] = False
 
-        return status
+        self._status_cache = status
 
     # ── Internal helpers ─────────────────────────────────────────────
 
-    async def _userpass_duo_flow(
-        self, username: str, password: str
-    ) -> tuple[str, int]:
-        """Execute userpass login + DUO MFA validation. Returns (token, ttl)."""
+    async def _coalesce(
+        self, attr: str, flow: Callable[[], Awaitable[str]]
+    ) -> str:
+        """Run `flow` once for all concurrent callers, tracked in `attr`.
+
+        The flow runs as its own task and is shielded, so a cancelled
+        caller doesn't abort a DUO push other callers are waiting on.
+        """
+        task = getattr(self, attr)
+        if task is None:
+            task = asyncio.create_task(flow())
+            setattr(self, attr, task)
+
+            def _done(t: asyncio.Task[str]) -> None:
+                setattr(self, attr, None)
+                if not t.cancelled():
+                    t.exception()  # mark retrieved if every caller went away
+
+            task.add_done_callback(_done)
+        return await asyncio.shield(task)
+
+    def _invalidate_secret(self, path: str) -> None:
+        """Drop cached reads of `path` for every tier."""
+        self._secret_cache_gen += 1
+        for tier in ("ro", "rw"):
+            self._secret_cache.pop((tier, path), None)
+
+    def _clear_secret_cache(self) -> None:
+        """Drop every cached read (tier change)."""
+        self._secret_cache_gen += 1
+        self._secret_cache.clear()
+
+    async def _get_cached_password(self, username: str) -> tuple[str, bool]:
+        """Return (password, was_cached) for `username`, fetching it once."""
+        async with self._userpass_cache_lock:
+            password = self._userpass_cache.get(username)
+            if password:
+                return password, True
+
+            kv_path = USERPASS_PASSWORD_PATHS[username]
+            password_data = await self._read_with_token(
+                kv_path, self._bootstrap_token
+            )
+            password = password_data.get("password")
+            if not password:
+                raise RuntimeError(
+                    f"Failed to retrieve {username} password from {kv_path}"
+                )
+            self._userpass_cache[username] = password
+            return password, False
+
+    async def _userpass_duo_flow(self, username: str) -> tuple[str, int]:
+        """Execute userpass login + DUO MFA validation. Returns (token, ttl).
+
+        If the login is rejected with a cached password, the password is
+        assumed rotated: it is re-fetched and the login retried once. A
+        rejected password that was just fetched is not retried (that would
+        only add a lockout strike), but is dropped from the cache.
+        """
+        password, was_cached = await self._get_cached_password(username)
         login_resp = await self._http.post(
             f"/v1/auth/userpass/login/{username}",
             json={"password": password},
         )
+        # Vault answers bad userpass credentials with 400, some setups 403
+        if login_resp.status_code in (400, 403):
+            self._userpass_cache.pop(username, None)
+        if login_resp.status_code in (400, 403) and was_cached:
+            password, _ = await self._get_cached_password(username)
+            login_resp = await self._http.post(
+                f"/v1/auth/userpass/login/{username}",
+                json={"password": password},
+            )
         login_resp.raise_for_status()
-        login_body = login_resp.json()
+        login_body = json_loads(login_resp.content)
 
         mfa_request_id = (
             login_body.get("auth", {})
@@ -329,16 +791,9 @@ class VaultClient:
                 f"Check that MFA enforcement is configured."
             )
 
-        mfa_resp = await self._http.post(
-            "/v1/sys/mfa/validate",
-            headers=self._headers(self._bootstrap_token),
-            json={
-                "mfa_request_id": mfa_request_id,
-                "mfa_payload": {DUO_METHOD_ID: []},
-            },
-        )
+        mfa_resp = await self._validate_mfa(mfa_request_id)
         mfa_resp.raise_for_status()
-        mfa_body = mfa_resp.json()
+        mfa_body = json_loads(mfa_resp.content)
 
         auth = mfa_body.get("auth", {})
         client_token = auth.get("client_token")
@@ -351,12 +806,65 @@ class VaultClient:
 
         return client_token, lease_duration
 
+    async def _validate_mfa(self, mfa_request_id: str) -> httpx.Response:
+        """POST sys/mfa/validate (fires the Duo push).
+
+        An unanswered push fails after MFA_PUSH_TIMEOUT. A 429 is retried
+        after its Retry-After, up to MFA_VALIDATE_ATTEMPTS in total.
+        """
+        attempt = 0
+        while True:
+            last_attempt = attempt == MFA_VALIDATE_ATTEMPTS - 1
+            backoff = MFA_RETRY_BACKOFF * 2**attempt
+            attempt += 1
+            try:
+                resp = await asyncio.wait_for(
+                    self._http.post(
+                        "/v1/sys/mfa/validate",
+                        headers=self._headers(self._bootstrap_token),
+                        json={
+                            "mfa_request_id": mfa_request_id,
+                            "mfa_payload": {DUO_METHOD_ID: []},
+                        },
+                    ),
+                    timeout=MFA_PUSH_TIMEOUT,
+                )
+            except TimeoutError:
+                raise RuntimeError(
+                    f"Duo push was not answered within {MFA_PUSH_TIMEOUT:.0f}s."
+                ) from None
+
+            if resp.status_code == 429 and not last_attempt:
+                await asyncio.sleep(_retry_after_seconds(resp, backoff))
+                continue
+            return resp
+
     async def _read_with_token(self, full_api_path: str, token: str) -> dict:
         """Read from a specific Vault API path with a specific token."""
         resp = await self._http.get(
             f"/v1/{full_api_path}",
             headers={"X-Vault-Token": token},
         )
-        resp.raise_for_status()
-        body = resp.json()
+        if resp.status_code >= 300:
+            resp.raise_for_status()
+        body = json_loads(resp.content)
         return body.get("data", {}).get("data", {})
+
+
+def _remaining_seconds(expiry_iso: str | None, now: datetime) -> float:
+    """Seconds until an ISO-8601 expiry, or 0 if missing/invalid/past."""
+    if not expiry_iso:
+        return 0.0
+    try:
+        return (datetime.fromisoformat(expiry_iso) - now).total_seconds()
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _retry_after_seconds(resp: httpx.Response, default: float) -> float:
+    """Parse a Retry-After header in seconds, capped at MFA_MAX_RETRY_AFTER."""
+    try:
+        delay = float(resp.headers.get("Retry-After", default))
+    except ValueError:  # HTTP-date form; not worth parsing here
+        delay = default
+    return min(max(delay, 0.0), MFA_MAX_RETRY_AFTER)